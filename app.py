@@ -2,6 +2,7 @@ from flask import Flask, request, jsonify, send_file, render_template
 import pandas as pd
 import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAIError, APIError, RateLimitError, APIConnectionError
 
 from llm.generate_synthetic_data import generate_synthetic_data
@@ -79,6 +80,7 @@ def analyze_code():
     try:
         import json
         from utils.code_analyzer import detect_language, parse_notebook, analyze_code_structure
+        from utils.json_utils import load_json
         from llm.code_review_llm import (
             review_code_with_llm,
             generate_unit_tests_with_llm,
@@ -133,28 +135,45 @@ def analyze_code():
             "structure": structure
         }
         
-        # Perform requested analyses
-        if review_code:
-            logger.info(f"Reviewing {language} code")
-            review_response = review_code_with_llm(code, language, filename)
-            result["review"] = json.loads(review_response)
+        # Perform requested analyses concurrently (each is an independent LLM call)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {}
+            
+            if review_code:
+                logger.info(f"Reviewing {language} code")
+                futures["review"] = executor.submit(
+                    review_code_with_llm, code, language, filename
+                )
+            
+            if generate_unit_tests:
+                logger.info(f"Generating unit tests for {language}")
+                futures["unit_tests"] = executor.submit(
+                    generate_unit_tests_with_llm, code, language, structure['test_framework']
+                )
+            
+            if generate_functional_tests:
+                logger.info(f"Generating functional tests for {language}")
+                futures["functional_tests"] = executor.submit(
+                    generate_functional_tests_with_llm, code, language, structure['test_framework']
+                )
+            
+            if generate_failure_data:
+                logger.info(f"Generating failure scenarios for {language}")
+                futures["failure_scenarios"] = executor.submit(
+                    generate_failure_scenarios_with_llm, code, language
+                )
         
-        if generate_unit_tests:
-            logger.info(f"Generating unit tests for {language}")
-            result["unit_tests"] = generate_unit_tests_with_llm(
-                code, language, structure['test_framework']
-            )
+        if "review" in futures:
+            result["review"] = load_json(futures["review"].result())
         
-        if generate_functional_tests:
-            logger.info(f"Generating functional tests for {language}")
-            result["functional_tests"] = generate_functional_tests_with_llm(
-                code, language, structure['test_framework']
-            )
+        if "unit_tests" in futures:
+            result["unit_tests"] = futures["unit_tests"].result()
         
-        if generate_failure_data:
-            logger.info(f"Generating failure scenarios for {language}")
-            failure_response = generate_failure_scenarios_with_llm(code, language)
-            failure_data = json.loads(failure_response)
+        if "functional_tests" in futures:
+            result["functional_tests"] = futures["functional_tests"].result()
+        
+        if "failure_scenarios" in futures:
+            failure_data = load_json(futures["failure_scenarios"].result())
             result["failure_scenarios"] = failure_data.get("scenarios", [])
         
         logger.info(f"Code analysis completed for {filename}")
@@ -15,6 +15,7 @@ if not OPENROUTER_API_KEY:
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 MODEL_NAME = "openai/gpt-4o-mini"
+LLM_MAX_RETRIES = 4  # Retries on rate limits, timeouts and 5xx, with jittered exponential backoff
 DEFAULT_ROWS = 50
 MAX_ROWS = 1000
 
@@ -4,12 +4,7 @@ from utils.cache import llm_cache
 from config.settings import MODEL_NAME
 
 
-@llm_cache.cached
-def _call_llm_for_augmentation(data_json: str, num_rows: int):
-    """
-    Internal function to call LLM API for data augmentation (cacheable).
-    """
-    system_prompt = """You are a data augmentation expert.
+_SYSTEM_PROMPT = """You are a data augmentation expert.
 
 Your task:
 - Generate new records that match the schema of the input data
@@ -32,6 +27,14 @@ Mandatory output format:
   ]
 }"""
 
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+@llm_cache.cached
+def _call_llm_for_augmentation(data_json: str, num_rows: int):
+    """
+    Internal function to call LLM API for data augmentation (cacheable).
+    """
     user_prompt = f"""Input data sample: {data_json[:1000]}
 
 Generate exactly {num_rows} new records with IDENTICAL schema.
@@ -40,7 +43,7 @@ Return ONLY the JSON object with "records" field."""
     response = get_client().chat.completions.create(
         model=MODEL_NAME,
         messages=[
-            {"role": "system", "content": system_prompt},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt}
         ],
         response_format={"type": "json_object"}
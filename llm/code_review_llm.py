@@ -3,12 +3,9 @@ from utils.cache import llm_cache
 from config.settings import MODEL_NAME
 
 
-@llm_cache.cached
-def review_code_with_llm(code: str, language: str, filename: str) -> dict:
-    """
-    Use LLM to review code for issues, best practices, and security concerns.
-    """
-    system_prompt = f"""You are an expert code reviewer for {language}.
+# System prompts are kept byte-identical across calls (no interpolation) so the
+# provider can reuse its prompt prefix cache; per-call details go in the user prompt.
+_REVIEW_SYSTEM_PROMPT = """You are an expert code reviewer.
 
 Analyze the code for:
 - Code quality issues
@@ -18,18 +15,70 @@ Analyze the code for:
 - Potential bugs
 
 Return JSON with this structure:
-{{
+{
   "issues": [
-    {{
+    {
       "line": <line_number>,
       "severity": "high|medium|low",
       "type": "security|performance|quality|bug",
       "message": "Description of the issue",
       "suggestion": "How to fix it"
-    }}
+    }
   ]
-}}"""
+}"""
+
+_UNIT_TEST_SYSTEM_PROMPT = """You are an expert test engineer.
+
+Generate comprehensive unit tests using the requested test framework.
+
+Requirements:
+- Test all functions
+- Include edge cases
+- Test boundary conditions
+- Add negative test cases
+- Use proper assertions
+
+Return ONLY the test code, no explanations."""
+
+_FUNCTIONAL_TEST_SYSTEM_PROMPT = """You are an expert test engineer.
+
+Generate functional/integration tests using the requested test framework.
+
+Focus on:
+- Component interactions
+- End-to-end workflows
+- Integration scenarios
+- API testing (if applicable)
+
+Return ONLY the test code."""
+
+_FAILURE_SCENARIOS_SYSTEM_PROMPT = """You are a security and QA expert.
+
+Generate failure scenarios that could break this code:
+- Edge case inputs
+- Boundary values
+- Invalid types
+- Malformed data
+- Security attack vectors
+
+Return JSON:
+{
+  "scenarios": [
+    {
+      "function": "function_name",
+      "input": "test input",
+      "reason": "why this might fail",
+      "expected": "expected behavior"
+    }
+  ]
+}"""
+
 
+@llm_cache.cached
+def review_code_with_llm(code: str, language: str, filename: str) -> dict:
+    """
+    Use LLM to review code for issues, best practices, and security concerns.
+    """
     user_prompt = f"""Review this {language} code from '{filename}':
 
 ```{language}
@@ -41,7 +90,7 @@ Return ONLY valid JSON with code review findings."""
     response = get_client().chat.completions.create(
         model="openai/gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _REVIEW_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ],
         response_format={"type": "json_object"}
@@ -55,19 +104,6 @@ def generate_unit_tests_with_llm(code: str, language: str, test_framework: str)
     """
     Generate unit tests for the code.
     """
-    system_prompt = f"""You are an expert test engineer for {language}.
-
-Generate comprehensive unit tests using {test_framework}.
-
-Requirements:
-- Test all functions
-- Include edge cases
-- Test boundary conditions
-- Add negative test cases
-- Use proper assertions
-
-Return ONLY the test code, no explanations."""
-
     user_prompt = f"""Generate {test_framework} unit tests for this {language} code:
 
 ```{language}
@@ -79,7 +115,7 @@ Return complete, runnable test code."""
     response = get_client().chat.completions.create(
         model="openai/gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _UNIT_TEST_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
     )
@@ -92,18 +128,6 @@ def generate_functional_tests_with_llm(code: str, language: str, test_framework:
     """
     Generate functional/integration tests.
     """
-    system_prompt = f"""You are an expert test engineer for {language}.
-
-Generate functional/integration tests using {test_framework}.
-
-Focus on:
-- Component interactions
-- End-to-end workflows
-- Integration scenarios
-- API testing (if applicable)
-
-Return ONLY the test code."""
-
     user_prompt = f"""Generate {test_framework} functional tests for this {language} code:
 
 ```{language}
@@ -115,7 +139,7 @@ Return complete, runnable test code."""
     response = get_client().chat.completions.create(
         model="openai/gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _FUNCTIONAL_TEST_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
     )
@@ -128,27 +152,6 @@ def generate_failure_scenarios_with_llm(code: str, language: str) -> str:
     """
     Generate failure scenarios and edge case inputs.
     """
-    system_prompt = f"""You are a security and QA expert for {language}.
-
-Generate failure scenarios that could break this code:
-- Edge case inputs
-- Boundary values
-- Invalid types
-- Malformed data
-- Security attack vectors
-
-Return JSON:
-{{
-  "scenarios": [
-    {{
-      "function": "function_name",
-      "input": "test input",
-      "reason": "why this might fail",
-      "expected": "expected behavior"
-    }}
-  ]
-}}"""
-
     user_prompt = f"""Generate failure scenarios for this {language} code:
 
 ```{language}
@@ -160,7 +163,7 @@ Return ONLY valid JSON."""
     response = get_client().chat.completions.create(
         model="openai/gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _FAILURE_SCENARIOS_SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ],
         response_format={"type": "json_object"}
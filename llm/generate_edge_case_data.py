@@ -1,12 +1,10 @@
 from llm.client import get_client
 from utils.json_utils import parse_records
+from utils.cache import llm_cache
 from config.settings import MODEL_NAME
 
-def generate_edge_case_data(df, prompt="", num_rows=10):
-    """
-    Generate edge case data based on input schema.
-    """
-    system_prompt = """You are a data testing expert.
+
+_SYSTEM_PROMPT = """You are a data testing expert.
 
 Generate edge case test data with extreme but valid values.
 
@@ -18,6 +16,30 @@ CRITICAL RULES:
 
 Mandatory format: {"records": [...]}"""
 
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+@llm_cache.cached
+def _call_llm_for_edge_cases(user_prompt: str):
+    """
+    Internal function to call LLM API for edge case generation (cacheable).
+    """
+    response = get_client().chat.completions.create(
+        model=MODEL_NAME,
+        messages=[
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt}
+        ],
+        response_format={"type": "json_object"}
+    )
+    
+    return response
+
+
+def generate_edge_case_data(df, prompt="", num_rows=10):
+    """
+    Generate edge case data based on input schema.
+    """
     # Use only first 10 rows as sample
     data_sample = df.head(10).to_dict(orient="records")
     
@@ -30,14 +52,7 @@ Generate exactly {num_rows} edge-case records with IDENTICAL schema.
 
     user_prompt += 'Return ONLY the JSON object with "records" field.'
 
-    response = get_client().chat.completions.create(
-        model=MODEL_NAME,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ],
-        response_format={"type": "json_object"}
-    )
+    # Call cached LLM function
+    response = _call_llm_for_edge_cases(user_prompt)
 
     return parse_records(response)
-
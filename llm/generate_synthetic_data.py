@@ -6,12 +6,7 @@ from utils.cache import llm_cache
 from config.settings import MODEL_NAME, DEFAULT_ROWS, MAX_ROWS
 
 
-@llm_cache.cached
-def _call_llm_for_synthetic_data(user_prompt: str):
-    """
-    Internal function to call LLM API (cacheable).
-    """
-    system_instruction = f"""
+_SYSTEM_INSTRUCTION = f"""
     You are an expert synthetic data architect.
 
     Your task:
@@ -29,10 +24,18 @@ def _call_llm_for_synthetic_data(user_prompt: str):
         "records": [{{ "column": "value" }}]
     }}"""
 
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_INSTRUCTION}
+
+
+@llm_cache.cached
+def _call_llm_for_synthetic_data(user_prompt: str):
+    """
+    Internal function to call LLM API (cacheable).
+    """
     response = get_client().chat.completions.create(
         model=MODEL_NAME,
         messages=[
-            {"role": "system", "content": system_instruction},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt}
         ],
         response_format={"type": "json_object"}
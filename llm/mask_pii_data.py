@@ -4,12 +4,7 @@ from utils.cache import llm_cache
 from config.settings import MODEL_NAME
 
 
-@llm_cache.cached
-def _call_llm_for_pii_masking(data_json: str, exclude_columns_str: str):
-    """
-    Internal function to call LLM API for PII masking (cacheable).
-    """
-    system_prompt = """You are a data privacy expert. Your job is to MASK personally identifiable information (PII).
+_SYSTEM_PROMPT = """You are a data privacy expert. Your job is to MASK personally identifiable information (PII).
 
 CRITICAL: You MUST change the PII values to masked versions. DO NOT return original values!
 
@@ -27,6 +22,14 @@ Output: {"Age": 42, "Income": "XXXXX", "Score": 720}
 
 Return JSON: {"records": [...]}"""
 
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+
+@llm_cache.cached
+def _call_llm_for_pii_masking(data_json: str, exclude_columns_str: str):
+    """
+    Internal function to call LLM API for PII masking (cacheable).
+    """
     user_prompt = f"""Mask PII in this data: {data_json[:2000]}
 
 Columns to NOT mask (keep original): {exclude_columns_str}
@@ -36,7 +39,7 @@ IMPORTANT: CHANGE the PII values! Return masked data in JSON format."""
     response = get_client().chat.completions.create(
         model="openai/gpt-4o-mini",  # Using better model for instruction following
         messages=[
-            {"role": "system", "content": system_prompt},
+            _SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt}
         ],
         response_format={"type": "json_object"}
@@ -11,6 +11,7 @@ from llm.mask_pii_data import mask_pii_data
 from llm.generate_edge_case_data import generate_edge_case_data
 from utils.file_comparator import compare_files
 from utils.code_analyzer import detect_language, parse_notebook, analyze_code_structure
+from utils.json_utils import load_json
 from llm.code_review_llm import (
     review_code_with_llm,
     generate_unit_tests_with_llm,
@@ -591,7 +592,7 @@ elif tool == "Code Review":
                     with st.spinner("Reviewing code..."):
                         try:
                             review_json = review_code_with_llm(code, language, uploaded_file.name)
-                            review = json.loads(review_json)
+                            review = load_json(review_json)
                             
                             if review.get('issues'):
                                 for issue in review['issues']:
@@ -643,7 +644,7 @@ elif tool == "Code Review":
                     with st.spinner("Generating failure scenarios..."):
                         try:
                             failures_json = generate_failure_scenarios_with_llm(code, language)
-                            failures = json.loads(failures_json)
+                            failures = load_json(failures_json)
                             
                             for scenario in failures.get('scenarios', []):
                                 st.warning(f"**Function:** {scenario.get('function', 'General')}")
@@ -1,5 +1,6 @@
 import hashlib
 import json
+import threading
 import time
 from typing import Any, Optional, Callable
 from functools import wraps
@@ -8,6 +9,8 @@ from functools import wraps
 class LLMCache:
     """
     In-memory cache for LLM responses with TTL (time-to-live) support.
+    
+    Thread-safe, so cached functions can be called from worker threads.
     """
     
     def __init__(self, ttl_seconds: int = 3600, max_size: int = 100):
@@ -21,6 +24,7 @@ class LLMCache:
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
         self._cache = {}
+        self._lock = threading.Lock()
         self._stats = {
             'hits': 0,
             'misses': 0,
@@ -47,7 +51,7 @@ class LLMCache:
         return time.time() - entry['timestamp'] > self.ttl_seconds
     
     def _evict_oldest(self):
-        """Remove the oldest entry from the cache."""
+        """Remove the oldest entry from the cache. Caller must hold the lock."""
         if not self._cache:
             return
         
@@ -66,20 +70,21 @@ class LLMCache:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            self._stats['misses'] += 1
-            return None
-        
-        entry = self._cache[key]
-        
-        # Check if expired
-        if self._is_expired(entry):
-            del self._cache[key]
-            self._stats['misses'] += 1
-            return None
-        
-        self._stats['hits'] += 1
-        return entry['value']
+        with self._lock:
+            if key not in self._cache:
+                self._stats['misses'] += 1
+                return None
+            
+            entry = self._cache[key]
+            
+            # Check if expired
+            if self._is_expired(entry):
+                del self._cache[key]
+                self._stats['misses'] += 1
+                return None
+            
+            self._stats['hits'] += 1
+            return entry['value']
     
     def set(self, key: str, value: Any):
         """
@@ -89,18 +94,20 @@ class LLMCache:
             key: Cache key
             value: Value to cache
         """
-        # Evict oldest if at max capacity
-        if len(self._cache) >= self.max_size and key not in self._cache:
-            self._evict_oldest()
-        
-        self._cache[key] = {
-            'value': value,
-            'timestamp': time.time()
-        }
+        with self._lock:
+            # Evict oldest if at max capacity
+            if len(self._cache) >= self.max_size and key not in self._cache:
+                self._evict_oldest()
+            
+            self._cache[key] = {
+                'value': value,
+                'timestamp': time.time()
+            }
     
     def clear(self):
         """Clear all cache entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
     
     def get_stats(self) -> dict:
         """
@@ -109,16 +116,17 @@ class LLMCache:
         Returns:
             Dictionary with hits, misses, evictions, and hit rate
         """
-        total_requests = self._stats['hits'] + self._stats['misses']
-        hit_rate = (self._stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-        
-        return {
-            'hits': self._stats['hits'],
-            'misses': self._stats['misses'],
-            'evictions': self._stats['evictions'],
-            'hit_rate': f"{hit_rate:.2f}%",
-            'total_entries': len(self._cache)
-        }
+        with self._lock:
+            total_requests = self._stats['hits'] + self._stats['misses']
+            hit_rate = (self._stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+            
+            return {
+                'hits': self._stats['hits'],
+                'misses': self._stats['misses'],
+                'evictions': self._stats['evictions'],
+                'hit_rate': f"{hit_rate:.2f}%",
+                'total_entries': len(self._cache)
+            }
     
     def cached(self, func: Callable) -> Callable:
         """
@@ -131,8 +139,9 @@ class LLMCache:
         """
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Generate cache key
-            cache_key = self._generate_key(*args, **kwargs)
+            # Generate cache key; the function is part of it so different
+            # functions called with the same arguments never share an entry
+            cache_key = self._generate_key(func.__module__, func.__qualname__, *args, **kwargs)
             
             # Try to get from cache
             cached_result = self.get(cache_key)
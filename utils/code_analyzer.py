@@ -1,112 +1,179 @@
-import json
-from typing import Dict, List, Any
+import ast
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+from utils.json_utils import load_json
+
+
+_LANGUAGE_MAP = {
+    # Python ecosystem
+    'py': 'python',
+    'ipynb': 'python',
+    'pyw': 'python',
+    
+    # JavaScript/TypeScript
+    'js': 'javascript',
+    'jsx': 'javascript',
+    'ts': 'typescript',
+    'tsx': 'typescript',
+    'mjs': 'javascript',
+    
+    # JVM languages
+    'java': 'java',
+    'scala': 'scala',
+    'kt': 'kotlin',
+    'kts': 'kotlin',
+    
+    # .NET languages
+    'cs': 'csharp',
+    'vb': 'vb',
+    'fs': 'fsharp',
+    
+    # Other compiled languages
+    'go': 'go',
+    'rs': 'rust',
+    'cpp': 'cpp',
+    'cc': 'cpp',
+    'cxx': 'cpp',
+    'c': 'c',
+    'h': 'c',
+    'hpp': 'cpp',
+    
+    # Scripting languages
+    'rb': 'ruby',
+    'php': 'php',
+    'pl': 'perl',
+    'lua': 'lua',
+    'sh': 'bash',
+    'bash': 'bash',
+    
+    # Data & Query languages
+    'sql': 'sql',
+    'hql': 'hive',
+    'r': 'r',
+    
+    # Web languages
+    'html': 'html',
+    'css': 'css',
+    'scss': 'scss',
+    'sass': 'sass',
+    
+    # Other
+    'swift': 'swift',
+    'dart': 'dart',
+    'groovy': 'groovy'
+}
+
+_TEST_FRAMEWORKS = {
+    'python': 'pytest',
+    'javascript': 'Jest',
+    'typescript': 'Jest',
+    'java': 'JUnit',
+    'scala': 'ScalaTest',
+    'kotlin': 'JUnit',
+    'csharp': 'NUnit',
+    'vb': 'NUnit',
+    'fsharp': 'NUnit',
+    'go': 'testing',
+    'rust': 'cargo test',
+    'cpp': 'Google Test',
+    'c': 'Unity',
+    'ruby': 'RSpec',
+    'php': 'PHPUnit',
+    'perl': 'Test::More',
+    'lua': 'busted',
+    'bash': 'bats',
+    'sql': 'tSQLt',
+    'hive': 'HiveQL',
+    'r': 'testthat',
+    'swift': 'XCTest',
+    'dart': 'test',
+    'groovy': 'Spock'
+}
+
+# Function-name patterns, compiled once at import time
+_FUNCTION_PATTERNS = {
+    'python': re.compile(r'def\s+(\w+)\s*\('),
+    'javascript': re.compile(r'function\s+(\w+)\s*\(|const\s+(\w+)\s*=\s*\('),
+    'typescript': re.compile(r'function\s+(\w+)\s*\(|const\s+(\w+)\s*=\s*\('),
+    'java': re.compile(r'(public|private|protected)?\s+\w+\s+(\w+)\s*\('),
+    'csharp': re.compile(r'(public|private|protected)?\s+\w+\s+(\w+)\s*\('),
+    'go': re.compile(r'func\s+(\w+)\s*\('),
+    'ruby': re.compile(r'def\s+(\w+)'),
+    'php': re.compile(r'function\s+(\w+)\s*\(')
+}
+_DEFAULT_FUNCTION_PATTERN = re.compile(r'function\s+(\w+)\s*\(')
 
 
 def detect_language(filename: str) -> str:
     """Detect programming language from file extension."""
-    ext = filename.lower().split('.')[-1]
-    
-    language_map = {
-        # Python ecosystem
-        'py': 'python',
-        'ipynb': 'python',
-        'pyw': 'python',
-        
-        # JavaScript/TypeScript
-        'js': 'javascript',
-        'jsx': 'javascript',
-        'ts': 'typescript',
-        'tsx': 'typescript',
-        'mjs': 'javascript',
-        
-        # JVM languages
-        'java': 'java',
-        'scala': 'scala',
-        'kt': 'kotlin',
-        'kts': 'kotlin',
-        
-        # .NET languages
-        'cs': 'csharp',
-        'vb': 'vb',
-        'fs': 'fsharp',
-        
-        # Other compiled languages
-        'go': 'go',
-        'rs': 'rust',
-        'cpp': 'cpp',
-        'cc': 'cpp',
-        'cxx': 'cpp',
-        'c': 'c',
-        'h': 'c',
-        'hpp': 'cpp',
-        
-        # Scripting languages
-        'rb': 'ruby',
-        'php': 'php',
-        'pl': 'perl',
-        'lua': 'lua',
-        'sh': 'bash',
-        'bash': 'bash',
-        
-        # Data & Query languages
-        'sql': 'sql',
-        'hql': 'hive',
-        'r': 'r',
-        
-        # Web languages
-        'html': 'html',
-        'css': 'css',
-        'scss': 'scss',
-        'sass': 'sass',
-        
-        # Other
-        'swift': 'swift',
-        'dart': 'dart',
-        'groovy': 'groovy'
-    }
+    ext = os.path.splitext(filename)[1][1:].lower()
+    if not ext:
+        return 'unknown'
     
-    return language_map.get(ext, 'unknown')
+    return _LANGUAGE_MAP.get(ext, 'unknown')
 
 
 def parse_notebook(ipynb_content: str) -> str:
     """Extract code from Jupyter notebook."""
     try:
-        notebook = json.loads(ipynb_content)
-        code_cells = []
+        notebook = load_json(ipynb_content)
+        
+        # Collect every source fragment in one flat list and join once,
+        # instead of joining each cell and then joining the cells again
+        fragments = []
+        has_code_cell = False
         
         for cell in notebook.get('cells', []):
             if cell.get('cell_type') == 'code':
+                if has_code_cell:
+                    fragments.append('\n\n')
+                has_code_cell = True
+                
                 source = cell.get('source', [])
                 if isinstance(source, list):
-                    code_cells.append(''.join(source))
+                    fragments.extend(source)
                 else:
-                    code_cells.append(source)
+                    fragments.append(source)
         
-        return '\n\n'.join(code_cells)
+        return ''.join(fragments)
     except Exception as e:
         raise ValueError(f"Error parsing Jupyter notebook: {str(e)}")
 
 
+@lru_cache(maxsize=32)
+def _python_function_names(code: str) -> Optional[Tuple[str, ...]]:
+    """Function names defined in Python source, or None if it does not parse.
+    
+    Only the names are cached; the AST is discarded after each parse.
+    """
+    try:
+        tree = ast.parse(code)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        # Valid but deeply nested code can exhaust the parser's recursion or
+        # memory limits; None sends the caller to the regex fallback
+        return None
+    return tuple({
+        node.name for node in ast.walk(tree)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    })
+
+
 def extract_functions(code: str, language: str) -> List[str]:
     """
-    Extract function names from code (simple regex-based extraction).
-    For production, use proper AST parsing.
+    Extract function names from code.
+    Python is parsed with the ast module; other languages (and Python that
+    does not parse, e.g. notebooks with magics) use simple regex extraction.
     """
-    import re
-    
-    patterns = {
-        'python': r'def\s+(\w+)\s*\(',
-        'javascript': r'function\s+(\w+)\s*\(|const\s+(\w+)\s*=\s*\(',
-        'typescript': r'function\s+(\w+)\s*\(|const\s+(\w+)\s*=\s*\(',
-        'java': r'(public|private|protected)?\s+\w+\s+(\w+)\s*\(',
-        'csharp': r'(public|private|protected)?\s+\w+\s+(\w+)\s*\(',
-        'go': r'func\s+(\w+)\s*\(',
-        'ruby': r'def\s+(\w+)',
-        'php': r'function\s+(\w+)\s*\('
-    }
+    if language == 'python':
+        names = _python_function_names(code)
+        if names is not None:
+            return list(names)
     
-    pattern = patterns.get(language, r'function\s+(\w+)\s*\(')
-    matches = re.findall(pattern, code)
+    pattern = _FUNCTION_PATTERNS.get(language, _DEFAULT_FUNCTION_PATTERN)
+    matches = pattern.findall(code)
     
     # Flatten tuples from regex groups
     functions = []
@@ -121,43 +188,16 @@ def extract_functions(code: str, language: str) -> List[str]:
 
 def get_test_framework(language: str) -> str:
     """Get appropriate test framework for language."""
-    frameworks = {
-        'python': 'pytest',
-        'javascript': 'Jest',
-        'typescript': 'Jest',
-        'java': 'JUnit',
-        'scala': 'ScalaTest',
-        'kotlin': 'JUnit',
-        'csharp': 'NUnit',
-        'vb': 'NUnit',
-        'fsharp': 'NUnit',
-        'go': 'testing',
-        'rust': 'cargo test',
-        'cpp': 'Google Test',
-        'c': 'Unity',
-        'ruby': 'RSpec',
-        'php': 'PHPUnit',
-        'perl': 'Test::More',
-        'lua': 'busted',
-        'bash': 'bats',
-        'sql': 'tSQLt',
-        'hive': 'HiveQL',
-        'r': 'testthat',
-        'swift': 'XCTest',
-        'dart': 'test',
-        'groovy': 'Spock'
-    }
-    return frameworks.get(language, 'unittest')
+    return _TEST_FRAMEWORKS.get(language, 'unittest')
 
 
 def analyze_code_structure(code: str, language: str) -> Dict[str, Any]:
     """Analyze code structure and return metadata."""
-    lines = code.split('\n')
     functions = extract_functions(code, language)
     
     return {
         'language': language,
-        'lines_of_code': len(lines),
+        'lines_of_code': code.count('\n') + 1,
         'functions': functions,
         'function_count': len(functions),
         'test_framework': get_test_framework(language)
@@ -1,8 +1,89 @@
+import io
 import pandas as pd
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any
 
 
+_MERGE_INDICATOR = "__compare_source__"
+
+
+def _read_csv(content: str) -> pd.DataFrame:
+    """Parse CSV text with the C engine."""
+    return pd.read_csv(io.StringIO(content), engine="c", low_memory=False)
+
+
+def _format_value(value: Any) -> str:
+    """Render one cell; missing values always render as 'nan'."""
+    return "nan" if pd.isna(value) else str(value)
+
+
+def _format_rows(df: pd.DataFrame) -> List[str]:
+    """Render each DataFrame row as 'v1 | v2 | ...' by concatenating whole columns."""
+    if df.empty:
+        return []
+    
+    columns = [df[col].map(_format_value) for col in df.columns]
+    formatted = columns[0]
+    for column in columns[1:]:
+        formatted = formatted + " | " + column
+    return formatted.tolist()
+
+
+def _row_index(df: pd.DataFrame) -> Dict[tuple, str]:
+    """
+    Map each distinct row to its formatted string.
+    
+    Values keep their column's dtype (rows are not upcast) and missing
+    values share one key, so formatting and matching agree with the
+    merge path in _compare_csv_rows.
+    """
+    rows = {}
+    for row in df.astype(object).itertuples(index=False, name=None):
+        key = tuple(None if pd.isna(value) else value for value in row)
+        if key not in rows:
+            rows[key] = " | ".join(_format_value(value) for value in row)
+    return rows
+
+
+def _compare_csv_rows(df1: pd.DataFrame, df2: pd.DataFrame) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Set-compare the distinct rows of two DataFrames.
+    
+    When both files have the same columns and dtypes, uses an outer merge on
+    all columns so the comparison runs in pandas' C paths. Otherwise falls
+    back to comparing row tuples. Both paths treat missing cells as equal to
+    each other and format each value according to its own column's dtype.
+    
+    Returns:
+        Tuple of (only_in_file1, only_in_file2, common) formatted rows
+    """
+    if (
+        len(df1.columns) > 0
+        and list(df1.columns) == list(df2.columns)
+        and list(df1.dtypes) == list(df2.dtypes)
+        and _MERGE_INDICATOR not in df1.columns
+    ):
+        merged = df1.drop_duplicates().merge(
+            df2.drop_duplicates(), how="outer", indicator=_MERGE_INDICATOR
+        )
+        source = merged.pop(_MERGE_INDICATOR)
+        return (
+            _format_rows(merged[source == "left_only"]),
+            _format_rows(merged[source == "right_only"]),
+            _format_rows(merged[source == "both"])
+        )
+    
+    rows1 = _row_index(df1)
+    rows2 = _row_index(df2)
+    
+    return (
+        [text for key, text in rows1.items() if key not in rows2],
+        [text for key, text in rows2.items() if key not in rows1],
+        [text for key, text in rows1.items() if key in rows2]
+    )
+
+
 def compare_csv(file1_content: str, file2_content: str, file1_name: str = "File 1", file2_name: str = "File 2") -> Dict[str, Any]:
     """
     Compare two CSV files.
@@ -10,33 +91,28 @@ def compare_csv(file1_content: str, file2_content: str, file1_name: str = "File
     Returns:
         Dictionary with comparison results
     """
+    # Parse both files concurrently; pandas' C parser releases the GIL
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(_read_csv, file1_content)
+        future2 = executor.submit(_read_csv, file2_content)
+    
     try:
-        df1 = pd.read_csv(pd.io.common.StringIO(file1_content))
+        df1 = future1.result()
     except Exception as e:
         raise ValueError(f"Error parsing CSV in '{file1_name}': {str(e)}")
     
     try:
-        df2 = pd.read_csv(pd.io.common.StringIO(file2_content))
+        df2 = future2.result()
     except Exception as e:
         raise ValueError(f"Error parsing CSV in '{file2_name}': {str(e)}")
     
     try:
-        # Convert to sets of tuples for comparison
-        set1 = set(df1.apply(tuple, axis=1))
-        set2 = set(df2.apply(tuple, axis=1))
-        
-        only_in_file1 = set1 - set2
-        only_in_file2 = set2 - set1
-        common = set1 & set2
-        
-        # Convert back to readable format
-        def format_row(row_tuple):
-            return " | ".join(str(x) for x in row_tuple)
+        only_in_file1, only_in_file2, common = _compare_csv_rows(df1, df2)
         
         return {
-            "only_in_file1": [format_row(row) for row in only_in_file1],
-            "only_in_file2": [format_row(row) for row in only_in_file2],
-            "common": [format_row(row) for row in common],
+            "only_in_file1": only_in_file1,
+            "only_in_file2": only_in_file2,
+            "common": common,
             "stats": {
                 "total_file1": len(df1),
                 "total_file2": len(df2),
@@ -49,6 +125,11 @@ def compare_csv(file1_content: str, file2_content: str, file1_name: str = "File
         raise ValueError(f"Error comparing CSV files: {str(e)}")
 
 
+def _normalize_newlines(text: str) -> str:
+    """Convert '\r\n' and '\r' line endings to '\n'."""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
 def compare_txt(file1_content: str, file2_content: str, file1_name: str = "File 1", file2_name: str = "File 2") -> Dict[str, Any]:
     """
     Compare two text files line by line.
@@ -56,8 +137,10 @@ def compare_txt(file1_content: str, file2_content: str, file1_name: str = "File
     Returns:
         Dictionary with comparison results
     """
-    lines1 = set(file1_content.strip().split('\n'))
-    lines2 = set(file2_content.strip().split('\n'))
+    # Blank lines are kept and an empty file is one empty line; '\r\n' and '\r'
+    # endings are normalised first so they do not leave a trailing '\r'
+    lines1 = set(_normalize_newlines(file1_content.strip()).split('\n'))
+    lines2 = set(_normalize_newlines(file2_content.strip()).split('\n'))
     
     only_in_file1 = lines1 - lines2
     only_in_file2 = lines2 - lines1
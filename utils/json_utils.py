@@ -2,9 +2,33 @@ import json
 import pandas as pd
 import logging
 
+try:
+    import orjson
+except ImportError:
+    # Optional speed-up; the stdlib parser is used when orjson is not installed
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def load_json(content):
+    """
+    Parse a JSON document from str or bytes.
+    
+    Uses orjson when it is installed and falls back to the stdlib parser,
+    which also accepts input orjson rejects (e.g. NaN literals).
+    
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 def parse_records(response):
     """
     Parse LLM response and convert to DataFrame.
@@ -27,7 +51,7 @@ def parse_records(response):
         # Log the raw response for debugging
         logger.debug(f"LLM Response content (first 500 chars): {content[:500]}")
         
-        parsed = json.loads(content)
+        parsed = load_json(content)
         
         # Check if parsed is empty
         if not parsed or len(parsed) == 0:
@@ -28,12 +28,19 @@ def validate_csv_file(file) -> Tuple[bool, Optional[str]]:
     if not file.filename.lower().endswith('.csv'):
         return False, f"Invalid file type. Expected .csv, got {file.filename.split('.')[-1]}"
     
+    max_size = 10 * 1024 * 1024  # 10MB
+    
+    # A declared part length is client-supplied, so it may only reject early;
+    # acceptance is always based on the measured stream size
+    declared_size = getattr(file, 'content_length', None) or 0
+    if declared_size > max_size:
+        return False, f"File too large. Maximum size is 10MB, got {declared_size / (1024*1024):.2f}MB"
+    
     # Check file size (max 10MB)
     file.seek(0, 2)  # Seek to end
     file_size = file.tell()
     file.seek(0)  # Reset to beginning
     
-    max_size = 10 * 1024 * 1024  # 10MB
     if file_size > max_size:
         return False, f"File too large. Maximum size is 10MB, got {file_size / (1024*1024):.2f}MB"
     
@@ -53,9 +60,12 @@ def validate_csv_content(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
     Returns:
         Tuple of (dataframe, error_message)
     """
+    max_rows = 10000
+    
     try:
-        # Try to read CSV
-        df = pd.read_csv(file)
+        # Read at most one row past the limit so oversized files are rejected
+        # without parsing them in full
+        df = pd.read_csv(file, nrows=max_rows + 1, engine='c')
         
         # Check if DataFrame is empty
         if df.empty:
@@ -70,9 +80,8 @@ def validate_csv_content(file) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
             return None, "CSV file must contain at least 1 row of data"
         
         # Check for maximum rows (prevent memory issues)
-        max_rows = 10000
         if len(df) > max_rows:
-            return None, f"CSV file has too many rows. Maximum is {max_rows}, got {len(df)}"
+            return None, f"CSV file has too many rows. Maximum is {max_rows}"
         
         return df, None
         